@@ -0,0 +1,254 @@
+# Dance Worlds Results API - local read-only HTTP service over the cleaned results
+# Loads the CSV once into per-column position indexes and serves filtered results and
+# title/podium/top 10 aggregates as JSON, with an LRU response cache and ETags
+
+import pandas as pd
+import numpy as np
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from functools import lru_cache
+from urllib.parse import urlsplit, parse_qsl
+import argparse
+import hashlib
+import json
+
+from dance_compact import load_compact
+
+# Query parameter -> dataset column, for the filters every endpoint accepts
+FILTERS = {
+    'year': 'Year',
+    'country': 'Country',
+    'division': 'Division',
+    'category': 'Category',
+    'dance_type': 'Dance_Type',
+    'studio': 'Studio_Name'
+}
+
+GROUP_BY = {
+    'year': 'Year',
+    'country': 'Country',
+    'division': 'Division',
+    'category': 'Category',
+    'dance_type': 'Dance_Type',
+    'studio': 'Studio_Name'
+}
+
+DEFAULT_PER_PAGE = 50
+MAX_PER_PAGE = 500
+
+class BadRequest(ValueError):
+    """Invalid query parameters, reported to the client as HTTP 400"""
+
+def filter_key(value):
+    """Case-insensitive, whitespace-trimmed key used for filter lookups"""
+    return str(value).strip().casefold()
+
+def load_results_store(csv_path='dance_worlds_clean_data.csv'):
+    """
+    Load the cleaned results once and index every filter column
+
+    Each index maps a normalised value to the sorted row positions holding it, so
+    a filtered query is a few array intersections instead of a scan.
+    """
+    df = load_compact(csv_path)
+
+    # Older exports lack the indicator columns, derive them from Rank
+    for column, max_rank in [('Is_Champion', 1), ('Is_Podium', 3), ('Is_Top_10', 10)]:
+        if column not in df.columns:
+            df[column] = (df['Rank'] <= max_rank).astype(np.uint8)
+
+    indexes = {}
+    for param, column in FILTERS.items():
+        if column not in df.columns:
+            continue
+        codes, uniques = pd.factorize(df[column].map(filter_key))
+        order = np.argsort(codes, kind='stable')
+        boundaries = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        indexes[param] = {
+            value: order[boundaries[i]:boundaries[i + 1]]
+            for i, value in enumerate(uniques)
+        }
+
+    return {
+        'df': df,
+        'records': df.astype(object).where(df.notna(), None).to_dict('records'),
+        'indexes': indexes,
+        'all_rows': np.arange(len(df))
+    }
+
+def select_rows(store, params):
+    """Row positions matching every filter; comma-separated values are OR-ed"""
+    rows = store['all_rows']
+
+    for param, column in FILTERS.items():
+        if param not in params:
+            continue
+        if param not in store['indexes']:
+            raise BadRequest(f"Dataset has no {column} column")
+
+        index = store['indexes'][param]
+        parts = [index.get(filter_key(value), np.empty(0, dtype=np.int64)) for value in params[param].split(',')]
+        matches = np.unique(np.concatenate(parts))
+        rows = np.intersect1d(rows, matches, assume_unique=True)
+
+    return rows
+
+def parse_int(params, name, default, minimum=1, maximum=None):
+    """Read a positive integer query parameter"""
+    try:
+        value = int(params.get(name, default))
+    except ValueError:
+        raise BadRequest(f"{name} must be an integer")
+    if maximum is None and value < minimum:
+        raise BadRequest(f"{name} must be at least {minimum}")
+    if maximum is not None and not minimum <= value <= maximum:
+        raise BadRequest(f"{name} must be between {minimum} and {maximum}")
+    return value
+
+def query_results(store, params):
+    """GET /results - filtered rows, paginated"""
+    rows = select_rows(store, params)
+    page = parse_int(params, 'page', 1)
+    per_page = parse_int(params, 'per_page', DEFAULT_PER_PAGE, maximum=MAX_PER_PAGE)
+
+    start = (page - 1) * per_page
+    page_rows = rows[start:start + per_page]
+
+    return {
+        'total': int(len(rows)),
+        'page': page,
+        'per_page': per_page,
+        'pages': int(-(-len(rows) // per_page)),
+        'results': [store['records'][i] for i in page_rows]
+    }
+
+def aggregate_results(store, params):
+    """GET /aggregates - performances, titles, podiums and top 10s per group, paginated"""
+    group_param = params.get('group_by', 'country')
+    if group_param not in GROUP_BY:
+        raise BadRequest(f"group_by must be one of: {', '.join(GROUP_BY)}")
+    column = GROUP_BY[group_param]
+    if column not in store['df'].columns:
+        raise BadRequest(f"Dataset has no {column} column")
+
+    rows = select_rows(store, params)
+    subset = store['df'].iloc[rows]
+    summary = subset.groupby(column, observed=True).agg(
+        Performances=('Rank', 'size'),
+        Titles=('Is_Champion', 'sum'),
+        Podiums=('Is_Podium', 'sum'),
+        Top_10s=('Is_Top_10', 'sum')
+    ).sort_values(['Titles', 'Podiums', 'Top_10s'], ascending=False).reset_index()
+
+    page = parse_int(params, 'page', 1)
+    per_page = parse_int(params, 'per_page', DEFAULT_PER_PAGE, maximum=MAX_PER_PAGE)
+    start = (page - 1) * per_page
+
+    return {
+        'group_by': group_param,
+        'total': int(len(summary)),
+        'page': page,
+        'per_page': per_page,
+        'pages': int(-(-len(summary) // per_page)),
+        'results': summary.iloc[start:start + per_page].to_dict('records')
+    }
+
+def list_values(store, params):
+    """GET /values - distinct values available for each filter"""
+    df = store['df']
+    return {
+        param: sorted(df[column].dropna().unique().tolist())
+        for param, column in FILTERS.items() if column in df.columns
+    }
+
+ENDPOINTS = {
+    '/results': query_results,
+    '/aggregates': aggregate_results,
+    '/values': list_values
+}
+
+def make_handler(store, cache_size=1024):
+    """
+    Build a request handler bound to one results store
+
+    Responses are rendered once per distinct (path, sorted query) and kept in an
+    LRU cache together with their ETag. The data is read-only, so entries never
+    go stale while the server runs.
+    """
+    @lru_cache(maxsize=cache_size)
+    def render(path, query):
+        params = dict(query)
+        try:
+            status, payload = 200, ENDPOINTS[path](store, params)
+        except BadRequest as e:
+            status, payload = 400, {'error': str(e)}
+        body = json.dumps(payload, default=str).encode('utf-8')
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        return status, body, etag
+
+    class ResultsHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are separate writes; without this keep-alive clients stall ~40ms
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            path = url.path.rstrip('/') or '/'
+
+            if path not in ENDPOINTS:
+                self.send_json(404, json.dumps({'error': f"Unknown endpoint {path}"}).encode('utf-8'))
+                return
+
+            query = tuple(sorted(parse_qsl(url.query)))
+            status, body, etag = render(path, query)
+
+            if status == 200 and self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+            self.send_json(status, body, etag)
+
+        def send_json(self, status, body, etag=None):
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'no-cache')
+            if etag:
+                self.send_header('ETag', etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ResultsHandler
+
+def serve_results(store, host='127.0.0.1', port=8000, cache_size=1024):
+    """Create the HTTP server for a loaded results store"""
+    return ThreadingHTTPServer((host, port), make_handler(store, cache_size))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local read-only Dance Worlds results API")
+    parser.add_argument('--csv', default='dance_worlds_clean_data.csv')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--cache-size', type=int, default=1024)
+    args = parser.parse_args()
+
+    store = load_results_store(args.csv)
+    server = serve_results(store, args.host, args.port, args.cache_size)
+
+    print(f"Loaded {len(store['df']):,} results from {args.csv}")
+    print(f"Serving on http://{args.host}:{args.port}")
+    print("   /results?year=2025&country=England&division=Open&dance_type=Jazz&studio=...&page=1&per_page=50")
+    print("   /aggregates?group_by=country&year=2025")
+    print("   /values")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServer stopped by user")
+    finally:
+        server.server_close()
@@ -0,0 +1,143 @@
+# Dance Worlds Results API - load test
+# Fires dashboard-style queries at a running dance_api.py server from several keep-alive
+# connections and reports requests/sec and latency percentiles, both for a fixed query
+# set (served from the response cache) and for random filter combinations (cache misses)
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit
+import argparse
+import http.client
+import itertools
+import json
+import random
+import time
+
+QUERIES = [
+    '/results?year=2025',
+    '/results?country=England',
+    '/results?division=Open&dance_type=Hip%20Hop',
+    '/results?studio=Pace%20Elite',
+    '/results?year=2024,2025&country=USA&page=2',
+    '/aggregates?group_by=country',
+    '/aggregates?group_by=studio&year=2025',
+    '/aggregates?group_by=year&country=Japan',
+    '/aggregates?group_by=dance_type&division=Senior',
+    '/values'
+]
+
+GROUP_BY_CHOICES = ['country', 'studio', 'year', 'division', 'category', 'dance_type']
+PER_PAGE_CHOICES = [10, 25, 50, 100]
+
+def fetch_values(host, port):
+    """Distinct filter values from GET /values, used to build random queries"""
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    try:
+        connection.request('GET', '/values')
+        return json.loads(connection.getresponse().read())
+    finally:
+        connection.close()
+
+def random_queries(values, seed=None):
+    """
+    Endless stream of random year/country/studio/page combinations
+
+    The combination space is far larger than the server's response cache, so almost
+    every request is rendered from scratch.
+    """
+    rng = random.Random(seed)
+    while True:
+        params = {}
+        if values.get('year') and rng.random() < 0.7:
+            params['year'] = ','.join(str(y) for y in rng.sample(values['year'], rng.randint(1, 2)))
+        if values.get('country') and rng.random() < 0.5:
+            params['country'] = rng.choice(values['country'])
+        if values.get('studio') and rng.random() < 0.2:
+            params['studio'] = rng.choice(values['studio'])
+        params['page'] = rng.randint(1, 5)
+        params['per_page'] = rng.choice(PER_PAGE_CHOICES)
+
+        if rng.random() < 0.5:
+            yield '/results?' + urlencode(params)
+        else:
+            params['group_by'] = rng.choice(GROUP_BY_CHOICES)
+            yield '/aggregates?' + urlencode(params)
+
+def run_connection(host, port, paths, deadline):
+    """Send requests over one keep-alive connection until the deadline, return latencies"""
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    latencies = []
+    errors = 0
+
+    for path in paths:
+        if time.perf_counter() >= deadline:
+            break
+        start = time.perf_counter()
+        try:
+            connection.request('GET', path)
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 400:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=10)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+    connection.close()
+    return latencies, errors
+
+def load_test(base_url='http://127.0.0.1:8000', connections=8, duration=10, queries=None, mix='cached', seed=2026):
+    """
+    Run the load test and print requests/sec with p50/p95/p99 latency
+
+    mix='cached' cycles the fixed `queries`, so after the first round every
+    response comes from the server's LRU cache. mix='uncached' sends random
+    filter combinations instead, measuring the cost of rendering each response.
+    """
+    url = urlsplit(base_url)
+    host, port = url.hostname, url.port or 80
+
+    if mix == 'uncached':
+        values = fetch_values(host, port)
+        paths = [random_queries(values, seed=seed + i) for i in range(connections)]
+    else:
+        queries = queries or QUERIES
+        paths = [itertools.islice(itertools.cycle(queries), i, None) for i in range(connections)]
+
+    deadline = time.perf_counter() + duration
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        futures = [executor.submit(run_connection, host, port, connection_paths, deadline)
+                   for connection_paths in paths]
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    latencies = np.concatenate([np.asarray(r[0]) for r in results]) * 1000
+    errors = sum(r[1] for r in results)
+
+    print(f"\nLoad test ({mix}): {base_url}, {connections} connections, {duration}s")
+    print(f"   Requests: {len(latencies):,} ({errors} errors)")
+    print(f"   Requests/sec: {len(latencies) / elapsed:,.0f}")
+    if len(latencies):
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        print(f"   Latency p50: {p50:.2f} ms, p95: {p95:.2f} ms, p99: {p99:.2f} ms")
+
+    return latencies, errors
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the Dance Worlds results API")
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--connections', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--mix', choices=['cached', 'uncached', 'both'], default='both',
+                        help="Fixed cache-hit queries, random cache-miss queries, or both runs")
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args()
+
+    mixes = ['cached', 'uncached'] if args.mix == 'both' else [args.mix]
+    for mix in mixes:
+        load_test(args.url, connections=args.connections, duration=args.duration, mix=mix, seed=args.seed)
@@ -0,0 +1,146 @@
+# Dance Worlds Compact Loader - dictionary-encoded in-memory results table
+# Repeated strings become categoricals, 0/1 flags uint8 and Year/Rank int16, while
+# Studio_Name and Team_Name share a single interned name table
+
+import pandas as pd
+import numpy as np
+import argparse
+import os
+import tempfile
+import time
+
+from dance_validation import COLUMN_ALIASES
+
+CATEGORY_COLUMNS = ['Division', 'Category', 'Dance_Type', 'Team_Size', 'Is_Coed', 'Country']
+FLAG_COLUMNS = ['Is_Champion', 'Is_Podium', 'Is_Top_10']
+SMALL_INT_COLUMNS = ['Year', 'Rank']
+NAME_COLUMNS = ['Studio_Name', 'Team_Name']
+
+def resolve_columns(columns, available):
+    """Columns from `columns` present in `available`, plus their scraper/notebook aliases"""
+    return [
+        column for column in available
+        if column in columns or COLUMN_ALIASES.get(column) in columns
+    ]
+
+def fits(series, dtype):
+    """True when every value of a complete numeric column fits in the integer dtype"""
+    if series.isna().any():
+        return False
+    if len(series) == 0:
+        return True
+    limits = np.iinfo(dtype)
+    return limits.min <= series.min() and series.max() <= limits.max
+
+def name_table(df):
+    """Sorted table of every distinct studio and team name in the frame"""
+    names = []
+    for column in resolve_columns(NAME_COLUMNS, df.columns):
+        values = df[column]
+        distinct = values.cat.categories if isinstance(values.dtype, pd.CategoricalDtype) else values.dropna().unique()
+        names.append(np.asarray(distinct, dtype=object))
+    return pd.Index(np.unique(np.concatenate(names)) if names else [], dtype=object)
+
+def intern_names(df, table=None):
+    """
+    Encode the name columns against one shared CategoricalDtype
+
+    Many teams are named after their studio, so a single intern table holds each
+    string once for both columns. Pass `table` to encode against an existing one,
+    e.g. to keep codes stable when appending a new scrape to loaded data.
+    """
+    if table is None:
+        table = name_table(df)
+    else:
+        table = table.append(name_table(df).difference(table))
+    dtype = pd.CategoricalDtype(categories=table)
+
+    for column in resolve_columns(NAME_COLUMNS, df.columns):
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].cat.set_categories(table)
+        else:
+            df[column] = df[column].astype(dtype)
+    return df
+
+def compact_frame(df, table=None):
+    """
+    Convert a results DataFrame (clean CSV, notebook or scraper output) in place
+
+    Columns that are absent are skipped and scraper/notebook names such as
+    Category_Standardized are recognised, so the same call works on every stage of
+    the pipeline. Integer columns are only narrowed when every value fits, otherwise
+    they keep their type. Returns the frame for chaining.
+    """
+    for column in resolve_columns(CATEGORY_COLUMNS, df.columns):
+        if not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+
+    for columns, dtype in [(FLAG_COLUMNS, np.uint8), (SMALL_INT_COLUMNS, np.int16)]:
+        for column in resolve_columns(columns, df.columns):
+            if pd.api.types.is_integer_dtype(df[column]) and fits(df[column], dtype):
+                df[column] = df[column].astype(dtype)
+
+    return intern_names(df, table)
+
+def load_compact(csv_path='dance_worlds_clean_data.csv', table=None):
+    """
+    Load a results CSV straight into the compact representation
+
+    Repeated strings are parsed directly into categoricals, so the full object
+    string frame is never materialised. Integer columns are parsed at full width
+    and narrowed by compact_frame once their range is known.
+    """
+    header = pd.read_csv(csv_path, nrows=0).columns
+    dtypes = {column: 'category' for column in resolve_columns(CATEGORY_COLUMNS + NAME_COLUMNS, header)}
+
+    df = pd.read_csv(csv_path, dtype=dtypes)
+    return compact_frame(df, table)
+
+def memory_mb(df):
+    """Deep memory use in MB"""
+    return df.memory_usage(deep=True).sum() / 1024 ** 2
+
+def benchmark_memory(csv_path='dance_worlds_clean_data.csv', copies=1000):
+    """
+    Compare pd.read_csv with load_compact on the dataset replicated `copies` times
+
+    Years are shifted per copy so the replicated table keeps realistic cardinality.
+    """
+    df = pd.read_csv(csv_path)
+    year_span = df['Year'].max() - df['Year'].min() + 1
+    big = pd.concat([df.assign(Year=df['Year'] + i * year_span) for i in range(copies)], ignore_index=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'replicated.csv')
+        big.to_csv(path, index=False)
+        del big
+
+        start = time.perf_counter()
+        plain = pd.read_csv(path)
+        plain_seconds = time.perf_counter() - start
+        plain_mb = memory_mb(plain)
+        del plain
+
+        start = time.perf_counter()
+        compact = load_compact(path)
+        compact_seconds = time.perf_counter() - start
+        compact_mb = memory_mb(compact)
+
+    print(f"\nMemory benchmark: {len(compact):,} rows")
+    print(f"   pd.read_csv:  {plain_mb:>8.1f} MB  ({plain_seconds:.2f}s)")
+    print(f"   load_compact: {compact_mb:>8.1f} MB  ({compact_seconds:.2f}s)")
+    print(f"   Reduction:    {plain_mb / compact_mb:>8.1f}x")
+
+    print(f"\nCompact column types:")
+    for column, dtype in compact.dtypes.items():
+        print(f"   {column}: {dtype}")
+
+    return plain_mb, compact_mb
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compact Dance Worlds results loader")
+    parser.add_argument('csv', nargs='?', default='dance_worlds_clean_data.csv')
+    parser.add_argument('--copies', type=int, default=1000, help="Replication factor for the benchmark")
+    args = parser.parse_args()
+
+    benchmark_memory(args.csv, copies=args.copies)
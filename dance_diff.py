@@ -0,0 +1,216 @@
+# Dance Worlds Dataset Diff - what changed between two scrape runs
+# Hashes a normalised natural key (Year, Category, Rank, Studio) and the row contents,
+# joins the hashes in linear time and writes a compact JSON lines changelog
+
+import pandas as pd
+import numpy as np
+from datetime import datetime
+import argparse
+import glob
+import json
+import os
+
+from dance_validation import normalise_columns
+
+KEY_COLUMNS = ['Year', 'Category', 'Rank', 'Studio_Name']
+
+# Odd 64-bit constant used to fold a duplicate key's occurrence number into its hash
+OCCURRENCE_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+def list_partitions(source):
+    """A CSV file, a directory of CSV partitions, or a glob pattern, in sorted order"""
+    if os.path.isdir(source):
+        return sorted(glob.glob(os.path.join(source, '*.csv')))
+    if os.path.exists(source):
+        return [source]
+    return sorted(glob.glob(source))
+
+def iter_chunks(source, chunksize=200000):
+    """Stream a dataset chunk by chunk across all of its partitions"""
+    partitions = list_partitions(source)
+    if not partitions:
+        raise FileNotFoundError(f"No CSV files found for {source}")
+
+    for path in partitions:
+        for chunk in pd.read_csv(path, chunksize=chunksize, dtype=str, keep_default_na=False):
+            yield normalise_columns(chunk)
+
+def normalise_uniques(series, normalise):
+    """
+    Apply `normalise` to each distinct value once and return a Categorical
+
+    Names and categories repeat across thousands of rows, so cleaning the distinct
+    values and hashing through category codes is far cheaper than per-row strings.
+    """
+    # Missing values get their own code; the default -1 would index the last unique
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    cleaned = normalise(pd.Series(uniques, dtype=object))
+    categories, inverse = np.unique(cleaned.to_numpy(dtype=str), return_inverse=True)
+    return pd.Categorical.from_codes(inverse[codes], categories)
+
+def normalise_text(series, casefold=False):
+    """Strip and collapse whitespace, optionally case-folding for key comparison"""
+    def clean(values):
+        values = values.astype(str).str.strip().str.replace(r'\s+', ' ', regex=True)
+        return values.str.casefold() if casefold else values
+    return normalise_uniques(series, clean)
+
+def normalise_number(series):
+    """'2025', '2025.0' and ' 2025 ' all become '2025'; '1.5' stays '1.5', non-numbers '<NA>'"""
+    def clean(values):
+        numbers = pd.to_numeric(values.astype(str).str.strip(), errors='coerce').astype(float)
+        integral = numbers.notna() & (numbers % 1 == 0)
+        text = numbers.astype(str)
+        text[integral] = numbers[integral].astype(np.int64).astype(str)
+        text[numbers.isna()] = '<NA>'
+        return text
+    return normalise_uniques(series, clean)
+
+def hash_chunk(chunk):
+    """Return (key hash, content hash) arrays for one chunk"""
+    missing = [column for column in KEY_COLUMNS if column not in chunk.columns]
+    if missing:
+        raise ValueError(f"Dataset is missing key columns: {', '.join(missing)}")
+
+    keys = pd.DataFrame({
+        'Year': normalise_number(chunk['Year']),
+        'Category': normalise_text(chunk['Category'], casefold=True),
+        'Rank': normalise_number(chunk['Rank']),
+        'Studio_Name': normalise_text(chunk['Studio_Name'], casefold=True)
+    })
+
+    # Columns are hashed in name order so a reordered CSV does not look changed
+    contents = pd.DataFrame({column: normalise_text(chunk[column]) for column in sorted(chunk.columns)})
+
+    key_hash = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    content_hash = pd.util.hash_pandas_object(contents, index=False).to_numpy()
+    return key_hash, content_hash
+
+def scan_hashes(source, chunksize=200000):
+    """
+    First pass: hash every row of a dataset without keeping the rows
+
+    Only 16 bytes per row are held in memory. Rows sharing a natural key (e.g. two
+    teams of one studio tied on rank) are told apart by their occurrence number.
+    """
+    key_parts = []
+    content_parts = []
+    for chunk in iter_chunks(source, chunksize):
+        key_hash, content_hash = hash_chunk(chunk)
+        key_parts.append(key_hash)
+        content_parts.append(content_hash)
+
+    key_hash = np.concatenate(key_parts) if key_parts else np.empty(0, dtype=np.uint64)
+    content_hash = np.concatenate(content_parts) if content_parts else np.empty(0, dtype=np.uint64)
+
+    occurrence = pd.Series(key_hash).groupby(key_hash, sort=False).cumcount().to_numpy().astype(np.uint64)
+    key_hash = key_hash ^ (occurrence * OCCURRENCE_MIX)
+
+    return key_hash, content_hash
+
+def join_hashes(old_keys, old_contents, new_keys, new_contents):
+    """
+    Hash join the two key arrays and classify every row
+
+    Returns row positions of added rows (in new), removed rows (in old) and
+    changed rows as (old position, new position) pairs.
+    """
+    old_positions = pd.Index(old_keys).get_indexer(new_keys)
+    matched = old_positions >= 0
+
+    added = np.flatnonzero(~matched)
+    matched_new = np.flatnonzero(matched)
+    matched_old = old_positions[matched]
+
+    differs = old_contents[matched_old] != new_contents[matched_new]
+    changed_old = matched_old[differs]
+    changed_new = matched_new[differs]
+
+    seen_old = np.zeros(len(old_keys), dtype=bool)
+    seen_old[matched_old] = True
+    removed = np.flatnonzero(~seen_old)
+
+    return added, removed, changed_old, changed_new
+
+def select_rows(source, positions, chunksize=200000):
+    """Second pass: stream a dataset again and yield (position, row dict) for the given rows"""
+    wanted = np.sort(positions)
+    offset = 0
+
+    for chunk in iter_chunks(source, chunksize):
+        start = np.searchsorted(wanted, offset)
+        stop = np.searchsorted(wanted, offset + len(chunk))
+        for position in wanted[start:stop]:
+            yield int(position), chunk.iloc[position - offset].to_dict()
+        offset += len(chunk)
+
+def key_of(row):
+    """Natural key fields of a row for the changelog"""
+    return {column: row.get(column, '') for column in KEY_COLUMNS}
+
+def diff_datasets(old_source, new_source, chunksize=200000):
+    """
+    Compare two datasets and yield changelog records
+
+    Each record is {'Change': 'added' | 'removed' | 'changed', 'Key': {...}}. Added
+    and removed records carry the full 'Row'; changed records carry only the fields
+    that changed as {'Field': [old, new]}.
+    """
+    old_keys, old_contents = scan_hashes(old_source, chunksize)
+    new_keys, new_contents = scan_hashes(new_source, chunksize)
+    added, removed, changed_old, changed_new = join_hashes(old_keys, old_contents, new_keys, new_contents)
+
+    # Old versions of changed rows are few, so hold them by new position for the merge
+    old_for_new = dict(zip(changed_old.tolist(), changed_new.tolist()))
+    previous_rows = {}
+
+    for position, row in select_rows(old_source, np.concatenate([removed, changed_old]), chunksize):
+        if position in old_for_new:
+            previous_rows[old_for_new[position]] = row
+        else:
+            yield {'Change': 'removed', 'Key': key_of(row), 'Row': row}
+
+    added_set = set(added.tolist())
+    for position, row in select_rows(new_source, np.concatenate([added, changed_new]), chunksize):
+        if position in added_set:
+            yield {'Change': 'added', 'Key': key_of(row), 'Row': row}
+        else:
+            previous = previous_rows[position]
+            fields = sorted(set(previous) | set(row))
+            changes = {
+                field: [previous.get(field), row.get(field)]
+                for field in fields if previous.get(field) != row.get(field)
+            }
+            yield {'Change': 'changed', 'Key': key_of(row), 'Changes': changes}
+
+def write_changelog(old_source, new_source, output_path, chunksize=200000):
+    """Write the diff as JSON lines and return the count per change type"""
+    counts = {'added': 0, 'removed': 0, 'changed': 0}
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for record in diff_datasets(old_source, new_source, chunksize):
+            counts[record['Change']] += 1
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    return counts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Diff two Dance Worlds datasets (files, directories or globs)")
+    parser.add_argument('old')
+    parser.add_argument('new')
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--chunksize', type=int, default=200000)
+    args = parser.parse_args()
+
+    output_path = args.output
+    if output_path is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = f'dance_worlds_changelog_{timestamp}.jsonl'
+
+    print(f"Comparing {args.old} -> {args.new}")
+    counts = write_changelog(args.old, args.new, output_path, chunksize=args.chunksize)
+
+    print(f"   Added: {counts['added']}")
+    print(f"   Removed: {counts['removed']}")
+    print(f"   Changed: {counts['changed']}")
+    print(f"Changelog saved as: {output_path}")
@@ -0,0 +1,195 @@
+# Dance Worlds Podium Forecast - Monte Carlo simulation of the next championship
+# Samples each studio's finishing position from its historical placements per category
+# and country, then counts how often each studio takes the title or a podium spot
+
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import argparse
+import os
+import time
+
+from dance_compact import load_compact
+
+def load_rank_history(csv_path='dance_worlds_clean_data.csv'):
+    """Load the cleaned results and add a field-size normalised placement"""
+    df = load_compact(csv_path)
+
+    # A 5th place out of 6 is not the same as 5th out of 29, so compare placements
+    # as a fraction of the field size for that year and category
+    field_size = df.groupby(['Year', 'Category'], observed=True)['Rank'].transform('max')
+    df['Placement'] = df['Rank'] / field_size
+
+    return df
+
+def build_category_inputs(df, lookback_years=3):
+    """
+    Build one simulation input per category
+
+    Entrants are the studios that reached the final in the category during the last
+    `lookback_years` editions. Each entrant carries its own placement history in the
+    category and the placement history of its country in the same category.
+    """
+    years = sorted(df['Year'].unique())
+    recent_years = years[-lookback_years:]
+
+    inputs = []
+
+    for category, category_df in df.groupby('Category', observed=True):
+        recent = category_df[category_df['Year'].isin(recent_years)]
+        if len(recent) == 0:
+            continue
+
+        entrants = recent[['Studio_Name', 'Country']].drop_duplicates('Studio_Name')
+        studio_pools = category_df.groupby('Studio_Name', observed=True)['Placement'].apply(np.asarray)
+        country_pools = category_df.groupby('Country', observed=True)['Placement'].apply(np.asarray)
+
+        inputs.append({
+            'Category': category,
+            'Studios': entrants['Studio_Name'].tolist(),
+            'Countries': entrants['Country'].tolist(),
+            'Studio_Pools': [studio_pools[s] for s in entrants['Studio_Name']],
+            'Country_Pools': [country_pools[c] for c in entrants['Country']]
+        })
+
+    return inputs
+
+def pad_pools(pools):
+    """Pack ragged placement histories into a padded 2D array plus lengths"""
+    lengths = np.array([len(pool) for pool in pools])
+    padded = np.zeros((len(pools), lengths.max()))
+    for i, pool in enumerate(pools):
+        padded[i, :len(pool)] = pool
+    return padded, lengths
+
+def simulate_category(category_input, n_simulations, seed_sequence, country_weight=0.25, noise=0.05):
+    """
+    Simulate `n_simulations` finals for one category in a single batched pass
+
+    For every simulation and entrant a placement is drawn from the studio's history,
+    or from its country's history with probability `country_weight`. A little
+    Gaussian noise breaks ties and the entrants are then ordered by placement.
+    """
+    rng = np.random.default_rng(seed_sequence)
+
+    studio_padded, studio_lengths = pad_pools(category_input['Studio_Pools'])
+    country_padded, country_lengths = pad_pools(category_input['Country_Pools'])
+    n_entrants = len(studio_lengths)
+    entrant_index = np.arange(n_entrants)
+
+    shape = (n_simulations, n_entrants)
+    studio_draw = studio_padded[entrant_index, (rng.random(shape) * studio_lengths).astype(np.int64)]
+    country_draw = country_padded[entrant_index, (rng.random(shape) * country_lengths).astype(np.int64)]
+
+    use_country = rng.random(shape) < country_weight
+    placements = np.where(use_country, country_draw, studio_draw)
+    placements += rng.normal(0.0, noise, shape)
+
+    # Position 0 is the champion in each simulated final
+    finishing_order = np.argsort(placements, axis=1)
+    positions = np.empty_like(finishing_order)
+    positions[np.arange(n_simulations)[:, None], finishing_order] = entrant_index
+
+    title_prob = (positions == 0).mean(axis=0)
+    podium_prob = (positions < 3).mean(axis=0)
+    expected_rank = positions.mean(axis=0) + 1
+
+    return pd.DataFrame({
+        'Category': category_input['Category'],
+        'Studio_Name': category_input['Studios'],
+        'Country': category_input['Countries'],
+        'Entrants': n_entrants,
+        'Title_Probability': title_prob,
+        'Podium_Probability': podium_prob,
+        'Expected_Rank': expected_rank
+    })
+
+def _simulate_category_job(job):
+    """Unpack arguments for the process pool"""
+    return simulate_category(*job)
+
+def run_forecast(df, n_simulations=10000, seed=2026, workers=None, lookback_years=3):
+    """
+    Run the forecast for every category, spreading categories across a process pool
+
+    Each category gets its own child seed spawned from `seed`, so the result is the
+    same regardless of how many workers are used.
+    """
+    inputs = build_category_inputs(df, lookback_years=lookback_years)
+    seeds = np.random.SeedSequence(seed).spawn(len(inputs))
+    jobs = [(category_input, n_simulations, child) for category_input, child in zip(inputs, seeds)]
+
+    if workers == 1:
+        results = [_simulate_category_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_simulate_category_job, jobs))
+
+    forecast = pd.concat(results, ignore_index=True)
+    forecast = forecast.sort_values(['Category', 'Title_Probability'], ascending=[True, False]).reset_index(drop=True)
+    return forecast
+
+def summarise_countries(forecast):
+    """Expected titles and podiums per country across all categories"""
+    summary = forecast.groupby('Country').agg(
+        Expected_Titles=('Title_Probability', 'sum'),
+        Expected_Podiums=('Podium_Probability', 'sum')
+    )
+    return summary.sort_values('Expected_Titles', ascending=False)
+
+def benchmark_forecast(df, n_simulations=10000, seed=2026, max_workers=None):
+    """Report simulations per second for 1..max_workers processes"""
+    max_workers = max_workers or os.cpu_count() or 1
+    n_categories = len(build_category_inputs(df))
+    total_simulations = n_simulations * n_categories
+
+    print(f"\nBenchmark: {n_simulations:,} simulations x {n_categories} categories")
+    print(f"{'Workers':>8} {'Seconds':>10} {'Sims/sec':>14}")
+
+    rows = []
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        run_forecast(df, n_simulations=n_simulations, seed=seed, workers=workers)
+        elapsed = time.perf_counter() - start
+        rate = total_simulations / elapsed
+        rows.append({'Workers': workers, 'Seconds': elapsed, 'Simulations_Per_Second': rate})
+        print(f"{workers:>8} {elapsed:>10.2f} {rate:>14,.0f}")
+
+    return pd.DataFrame(rows)
+
+def print_forecast_summary(forecast, top_n=3):
+    """Print the favourites in each category and the country outlook"""
+    print(f"\nForecast favourites by category:")
+    for category, category_df in forecast.groupby('Category'):
+        print(f"\n   {category} ({category_df['Entrants'].iloc[0]} entrants)")
+        for _, row in category_df.head(top_n).iterrows():
+            print(f"      {row['Studio_Name']} ({row['Country']}): "
+                  f"title {row['Title_Probability']:.1%}, podium {row['Podium_Probability']:.1%}")
+
+    print(f"\nExpected titles by country:")
+    countries = summarise_countries(forecast).head(10)
+    for country, row in countries.iterrows():
+        print(f"   {country}: {row['Expected_Titles']:.2f} titles, {row['Expected_Podiums']:.2f} podiums")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo podium forecast for the next Dance Worlds")
+    parser.add_argument('--csv', default='dance_worlds_clean_data.csv')
+    parser.add_argument('--simulations', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=2026)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--benchmark', action='store_true')
+    args = parser.parse_args()
+
+    df = load_rank_history(args.csv)
+
+    if args.benchmark:
+        benchmark_forecast(df, n_simulations=args.simulations, seed=args.seed, max_workers=args.workers)
+    else:
+        forecast = run_forecast(df, n_simulations=args.simulations, seed=args.seed, workers=args.workers)
+        print_forecast_summary(forecast)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f'dance_worlds_forecast_{timestamp}.csv'
+        forecast.to_csv(filename, index=False)
+        print(f"\nForecast saved as: {filename}")
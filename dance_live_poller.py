@@ -0,0 +1,296 @@
+# Dance Worlds Live Results Poller - championship weekend mode
+# Polls the rankings page with conditional GETs, re-extracts only the ranking tables
+# whose content changed and writes new or changed placements as JSON lines
+
+import requests
+from bs4 import BeautifulSoup
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from email.utils import formatdate, parsedate_to_datetime
+from datetime import datetime
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import threading
+
+from dance_scraper_clean import detect_ranking_category, detect_ranking_round, extract_ranking_table
+
+RANKINGS_URL = "https://thedanceworlds.net/rankings/"
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+def new_poll_state():
+    """Validators, table hashes and last seen placements carried between polls"""
+    return {
+        'etag': None,
+        'last_modified': None,
+        'table_hashes': {},
+        'placements': {}
+    }
+
+def fetch_if_changed(session, url, state):
+    """
+    Conditional GET using the ETag / Last-Modified from the previous response
+
+    Returns the page HTML, or None when the server answers 304 Not Modified.
+    """
+    headers = dict(HEADERS)
+    if state['etag']:
+        headers['If-None-Match'] = state['etag']
+    if state['last_modified']:
+        headers['If-Modified-Since'] = state['last_modified']
+
+    response = session.get(url, headers=headers, timeout=30)
+
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+
+    state['etag'] = response.headers.get('ETag')
+    state['last_modified'] = response.headers.get('Last-Modified')
+    return response.text
+
+def hash_table(table):
+    """Hash the visible text of a ranking table"""
+    return hashlib.sha256(table.get_text('|', strip=True).encode('utf-8')).hexdigest()
+
+def table_context(table):
+    """Find the category and round from the nearest headings before a table"""
+    category = None
+    round_name = None
+
+    for element in table.find_all_previous(['h1', 'h2', 'h3', 'h4', 'p']):
+        text = element.get_text(strip=True).upper()
+        if category is None:
+            category = detect_ranking_category(text)
+        if round_name is None:
+            round_name = detect_ranking_round(text)
+        if category and round_name:
+            break
+
+    return category or 'Unknown', round_name or 'Unknown'
+
+def extract_changed_tables(html_content, state, year=2025):
+    """
+    Re-extract only the ranking tables whose hash differs from the previous poll
+
+    Tables are keyed by category, round and position within that heading so a
+    table added elsewhere on the page does not invalidate the others.
+    """
+    soup = BeautifulSoup(html_content, 'html.parser')
+    records = []
+    seen_keys = {}
+
+    for table in soup.find_all('table'):
+        category, round_name = table_context(table)
+        occurrence = seen_keys.get((category, round_name), 0)
+        seen_keys[(category, round_name)] = occurrence + 1
+        key = f"{category}|{round_name}|{occurrence}"
+
+        table_hash = hash_table(table)
+        if state['table_hashes'].get(key) == table_hash:
+            continue
+
+        state['table_hashes'][key] = table_hash
+        records.extend(extract_ranking_table(table, category, round_name, year=year))
+
+    return records
+
+def placement_deltas(records, state):
+    """Compare extracted records with the last seen placements and return the changes"""
+    deltas = []
+    detected_at = datetime.now().isoformat(timespec='seconds')
+
+    for record in records:
+        key = (record['Category'], record['Round'], record['Studio_Name'], record['Team_Name'])
+        previous = state['placements'].get(key)
+
+        if previous is None:
+            change = 'new'
+        elif (previous['Rank'], previous['Raw_Score'], previous['Event_Score']) != \
+                (record['Rank'], record['Raw_Score'], record['Event_Score']):
+            change = 'changed'
+        else:
+            continue
+
+        state['placements'][key] = record
+        deltas.append({
+            'Change': change,
+            'Detected_At': detected_at,
+            'Year': record['Year'],
+            'Category': record['Category'],
+            'Round': record['Round'],
+            'Rank': record['Rank'],
+            'Previous_Rank': previous['Rank'] if previous else None,
+            'Studio_Name': record['Studio_Name'],
+            'Team_Name': record['Team_Name'],
+            'Country': record['Country'],
+            'Raw_Score': record['Raw_Score'],
+            'Event_Score': record['Event_Score']
+        })
+
+    return deltas
+
+def process_page(html_content, state, year=2025):
+    """Re-extract the changed tables of one page and return (records, deltas)"""
+    records = extract_changed_tables(html_content, state, year=year)
+    return records, placement_deltas(records, state)
+
+def save_snapshot(html_content, snapshot_dir):
+    """Keep a copy of each changed page so the weekend can be replayed later"""
+    os.makedirs(snapshot_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    filename = os.path.join(snapshot_dir, f'rankings_{timestamp}.html')
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+    return filename
+
+async def poll_rankings(url=RANKINGS_URL, interval=60, output=sys.stdout, max_polls=None,
+                        year=2025, snapshot_dir=None):
+    """
+    Poll the rankings page and write one JSON line per new or changed placement
+
+    Blocking HTTP calls and the HTML parse run in a worker thread so the poller
+    can share an event loop with other tasks. Progress goes to stderr to keep
+    stdout a clean stream.
+    """
+    state = new_poll_state()
+    session = requests.Session()
+    polls = 0
+
+    while max_polls is None or polls < max_polls:
+        polls += 1
+
+        try:
+            html_content = await asyncio.to_thread(fetch_if_changed, session, url, state)
+        except requests.RequestException as e:
+            print(f"Poll {polls}: error {e}", file=sys.stderr)
+            html_content = None
+        else:
+            if html_content is None:
+                print(f"Poll {polls}: not modified", file=sys.stderr)
+
+        if html_content is not None:
+            if snapshot_dir:
+                save_snapshot(html_content, snapshot_dir)
+
+            records, deltas = await asyncio.to_thread(process_page, html_content, state, year)
+            for delta in deltas:
+                output.write(json.dumps(delta) + '\n')
+            output.flush()
+            print(f"Poll {polls}: {len(records)} records re-extracted, {len(deltas)} changes", file=sys.stderr)
+
+        if max_polls is None or polls < max_polls:
+            await asyncio.sleep(interval)
+
+    session.close()
+    return state
+
+def serve_snapshots(snapshot_dir, port=8765, send_etag=True):
+    """
+    Local stub server that replays saved rankings pages in filename order
+
+    Every request, whether answered 200 or 304, advances to the next snapshot
+    (staying on the last one), so each poll sees the page as it stood at that
+    moment. If-None-Match is checked against the snapshot's ETag and, as in HTTP,
+    takes precedence; otherwise If-Modified-Since is checked against the file's
+    modification time (whole seconds). Pass send_etag=False to serve only
+    Last-Modified and exercise the poller's If-Modified-Since path.
+    Returns the running server.
+    """
+    snapshots = sorted(
+        os.path.join(snapshot_dir, name) for name in os.listdir(snapshot_dir)
+        if name.endswith('.html')
+    )
+    if not snapshots:
+        raise ValueError(f"No .html snapshots found in {snapshot_dir}")
+
+    replay = {'index': 0}
+    lock = threading.Lock()
+
+    class SnapshotHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                path = snapshots[min(replay['index'], len(snapshots) - 1)]
+                replay['index'] += 1
+
+            with open(path, 'rb') as f:
+                body = f.read()
+            etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"' if send_etag else None
+            modified_at = int(os.path.getmtime(path))
+
+            if self.not_modified(etag, modified_at):
+                self.send_response(304)
+                if etag:
+                    self.send_header('ETag', etag)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            if etag:
+                self.send_header('ETag', etag)
+            self.send_header('Last-Modified', formatdate(modified_at, usegmt=True))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def not_modified(self, etag, modified_at):
+            if_none_match = self.headers.get('If-None-Match')
+            if if_none_match is not None:
+                return etag is not None and if_none_match == etag
+
+            if_modified_since = self.headers.get('If-Modified-Since')
+            if if_modified_since:
+                try:
+                    since = parsedate_to_datetime(if_modified_since).timestamp()
+                except (TypeError, ValueError):
+                    return False
+                return modified_at <= since
+            return False
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), SnapshotHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Poll Dance Worlds rankings and stream placement changes")
+    parser.add_argument('--url', default=RANKINGS_URL)
+    parser.add_argument('--interval', type=float, default=60)
+    parser.add_argument('--max-polls', type=int, default=None)
+    parser.add_argument('--year', type=int, default=2025, help="Year stamped on extracted placements")
+    parser.add_argument('--output', default=None, help="JSON lines file (default: stdout)")
+    parser.add_argument('--save-snapshots', default=None, help="Directory to store changed pages")
+    parser.add_argument('--replay', default=None, help="Serve saved snapshots locally and poll them")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--no-etag', action='store_true', help="Replay server sends only Last-Modified")
+    args = parser.parse_args()
+
+    url = args.url
+    server = None
+    if args.replay:
+        server = serve_snapshots(args.replay, port=args.port, send_etag=not args.no_etag)
+        url = f"http://127.0.0.1:{args.port}/rankings/"
+        print(f"Replaying snapshots from {args.replay} at {url}", file=sys.stderr)
+
+    output = open(args.output, 'a', encoding='utf-8') if args.output else sys.stdout
+
+    try:
+        asyncio.run(poll_rankings(url, interval=args.interval, output=output, max_polls=args.max_polls,
+                                  year=args.year, snapshot_dir=args.save_snapshots))
+    except KeyboardInterrupt:
+        print("\nPolling stopped by user", file=sys.stderr)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        if server:
+            server.shutdown()
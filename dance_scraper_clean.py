@@ -10,6 +10,8 @@ from datetime import datetime
 import time
 import json
 
+from dance_validation import validate_dataset, print_validation_report
+
 def scrape_dance_worlds_enhanced():
     """
     Enhanced scraper with better data extraction methods and 2025 rankings
@@ -100,128 +102,157 @@ def extract_2025_rankings(html_content, url):
         text = element.get_text(strip=True).upper()
         
         # Detect competition round
-        if 'FINALS' in text and 'SEMI' not in text:
-            current_round = 'Finals'
-        elif 'SEMI-FINALS' in text:
-            current_round = 'Semi-Finals'
-        elif 'PRELIMS' in text:
-            current_round = 'Prelims'
+        round_name = detect_ranking_round(text)
+        if round_name:
+            current_round = round_name
         
         # Detect dance categories
-        if any(category in text for category in ['KICK', 'CONTEMPORARY', 'LYRICAL', 'JAZZ', 'POM', 'HIP HOP', 'COED']):
-            # Extract category details
-            if 'SENIOR KICK' in text:
-                current_category = 'Senior Kick'
-            elif 'SENIOR SMALL CONTEMPORARY' in text or 'SENIOR SMALL LYRICAL' in text:
-                current_category = 'Senior Small Contemporary/Lyrical'
-            elif 'SENIOR LARGE CONTEMPORARY' in text or 'SENIOR LARGE LYRICAL' in text:
-                current_category = 'Senior Large Contemporary/Lyrical'
-            elif 'SENIOR SMALL JAZZ' in text:
-                current_category = 'Senior Small Jazz'
-            elif 'SENIOR LARGE JAZZ' in text:
-                current_category = 'Senior Large Jazz'
-            elif 'SENIOR SMALL POM' in text:
-                current_category = 'Senior Small Pom'
-            elif 'SENIOR LARGE POM' in text:
-                current_category = 'Senior Large Pom'
-            elif 'SENIOR SMALL HIP HOP' in text:
-                current_category = 'Senior Small Hip Hop'
-            elif 'SENIOR LARGE HIP HOP' in text:
-                current_category = 'Senior Large Hip Hop'
-            elif 'SENIOR SMALL COED HIP HOP' in text:
-                current_category = 'Senior Small Coed Hip Hop'
-            elif 'SENIOR LARGE COED HIP HOP' in text:
-                current_category = 'Senior Large Coed Hip Hop'
-            elif 'OPEN' in text and 'LYRICAL' in text:
-                current_category = 'Open Contemporary/Lyrical'
-            elif 'OPEN' in text and 'JAZZ' in text and 'COED' not in text:
-                current_category = 'Open Jazz'
-            elif 'OPEN' in text and 'JAZZ' in text and 'COED' in text:
-                current_category = 'Open Coed Jazz'
-            elif 'OPEN' in text and 'POM' in text and 'COED' not in text:
-                current_category = 'Open Pom'
-            elif 'OPEN' in text and 'POM' in text and 'COED' in text:
-                current_category = 'Open Coed Pom'
-            elif 'OPEN' in text and 'HIP HOP' in text and 'COED' not in text:
-                current_category = 'Open Hip Hop'
-            elif 'OPEN' in text and 'HIP HOP' in text and 'COED' in text:
-                current_category = 'Open Coed Hip Hop'
-            elif 'JUNIOR' in text:
-                current_category = 'Junior Dance'
+        category = detect_ranking_category(text)
+        if category:
+            current_category = category
     
     # Process each table
     for table in tables:
-        rows = table.find_all('tr')
+        records.extend(extract_ranking_table(table, current_category, current_round))
+    
+    print(f"   Extracted {len(records)} records from 2025 rankings")
+    return records
+
+def extract_ranking_table(table, category, round_name, year=2025):
+    """
+    Extract ranking records from a single table on the rankings page for `year`
+    """
+    records = []
+    rows = table.find_all('tr')
+    
+    # Skip if no rows
+    if not rows:
+        return records
         
-        # Skip if no rows
-        if not rows:
+    # Check if this is a ranking table by looking for ranking headers
+    header_row = rows[0] if rows else None
+    if header_row:
+        header_text = header_row.get_text().upper()
+        if not any(word in header_text for word in ['RANKING', 'RANK', 'CLUB', 'TEAM']):
+            return records
+    
+    # Process data rows (skip header)
+    for row in rows[1:]:
+        cells = row.find_all(['td', 'th'])
+        if len(cells) < 3:
             continue
             
-        # Check if this is a ranking table by looking for ranking headers
-        header_row = rows[0] if rows else None
-        if header_row:
-            header_text = header_row.get_text().upper()
-            if not any(word in header_text for word in ['RANKING', 'RANK', 'CLUB', 'TEAM']):
-                continue
+        cell_texts = [cell.get_text(strip=True) for cell in cells]
         
-        # Process data rows (skip header)
-        for row in rows[1:]:
-            cells = row.find_all(['td', 'th'])
-            if len(cells) < 3:
+        try:
+            # Extract ranking (first column)
+            rank_text = cell_texts[0]
+            rank_match = re.search(r'(\d+)', rank_text)
+            if not rank_match:
                 continue
-                
-            cell_texts = [cell.get_text(strip=True) for cell in cells]
+            rank = int(rank_match.group(1))
             
-            try:
-                # Extract ranking (first column)
-                rank_text = cell_texts[0]
-                rank_match = re.search(r'(\d+)', rank_text)
-                if not rank_match:
-                    continue
-                rank = int(rank_match.group(1))
-                
-                # Extract club/studio (second column)
-                club = cell_texts[1] if len(cell_texts) > 1 else ""
-                
-                # Extract team name (third column)
-                team = cell_texts[2] if len(cell_texts) > 2 else ""
-                
-                # Extract scores if available
-                raw_score = ""
-                event_score = ""
-                if len(cell_texts) > 3:
-                    for i, cell in enumerate(cell_texts[3:], 3):
-                        if re.match(r'^\d+\.?\d*$', cell):
-                            if not raw_score:
-                                raw_score = cell
-                            elif not event_score:
-                                event_score = cell
-                
-                # Determine country from team name or context
-                country = extract_country_from_text(f"{club} {team}")
-                
-                # Create record
-                record = {
-                    'Year': 2025,
-                    'Rank': rank,
-                    'Category': current_category,
-                    'Studio_Name': club,
-                    'Team_Name': team,
-                    'Country': country,
-                    'Round': current_round,
-                    'Raw_Score': raw_score,
-                    'Event_Score': event_score,
-                    'Source': '2025_Rankings_Table'
-                }
-                
-                records.append(record)
-                
-            except (ValueError, IndexError) as e:
-                continue
+            # Extract club/studio (second column)
+            club = cell_texts[1] if len(cell_texts) > 1 else ""
+            
+            # Extract team name (third column)
+            team = cell_texts[2] if len(cell_texts) > 2 else ""
+            
+            # Extract scores if available
+            raw_score = ""
+            event_score = ""
+            if len(cell_texts) > 3:
+                for i, cell in enumerate(cell_texts[3:], 3):
+                    if re.match(r'^\d+\.?\d*$', cell):
+                        if not raw_score:
+                            raw_score = cell
+                        elif not event_score:
+                            event_score = cell
+            
+            # Determine country from team name or context
+            country = extract_country_from_text(f"{club} {team}")
+            
+            # Create record
+            record = {
+                'Year': year,
+                'Rank': rank,
+                'Category': category,
+                'Studio_Name': club,
+                'Team_Name': team,
+                'Country': country,
+                'Round': round_name,
+                'Raw_Score': raw_score,
+                'Event_Score': event_score,
+                'Source': f'{year}_Rankings_Table'
+            }
+            
+            records.append(record)
+            
+        except (ValueError, IndexError) as e:
+            continue
     
-    print(f"   Extracted {len(records)} records from 2025 rankings")
     return records
 
+def detect_ranking_round(text):
+    """
+    Map an upper-cased heading text to a competition round, or None if it names no round
+    """
+    if 'FINALS' in text and 'SEMI' not in text:
+        return 'Finals'
+    elif 'SEMI-FINALS' in text:
+        return 'Semi-Finals'
+    elif 'PRELIMS' in text:
+        return 'Prelims'
+    
+    return None
+
+def detect_ranking_category(text):
+    """
+    Map an upper-cased heading text to a ranking category, or None if it names no category
+    """
+    if any(category in text for category in ['KICK', 'CONTEMPORARY', 'LYRICAL', 'JAZZ', 'POM', 'HIP HOP', 'COED']):
+        # Extract category details
+        if 'SENIOR KICK' in text:
+            return 'Senior Kick'
+        elif 'SENIOR SMALL CONTEMPORARY' in text or 'SENIOR SMALL LYRICAL' in text:
+            return 'Senior Small Contemporary/Lyrical'
+        elif 'SENIOR LARGE CONTEMPORARY' in text or 'SENIOR LARGE LYRICAL' in text:
+            return 'Senior Large Contemporary/Lyrical'
+        elif 'SENIOR SMALL JAZZ' in text:
+            return 'Senior Small Jazz'
+        elif 'SENIOR LARGE JAZZ' in text:
+            return 'Senior Large Jazz'
+        elif 'SENIOR SMALL POM' in text:
+            return 'Senior Small Pom'
+        elif 'SENIOR LARGE POM' in text:
+            return 'Senior Large Pom'
+        elif 'SENIOR SMALL HIP HOP' in text:
+            return 'Senior Small Hip Hop'
+        elif 'SENIOR LARGE HIP HOP' in text:
+            return 'Senior Large Hip Hop'
+        elif 'SENIOR SMALL COED HIP HOP' in text:
+            return 'Senior Small Coed Hip Hop'
+        elif 'SENIOR LARGE COED HIP HOP' in text:
+            return 'Senior Large Coed Hip Hop'
+        elif 'OPEN' in text and 'LYRICAL' in text:
+            return 'Open Contemporary/Lyrical'
+        elif 'OPEN' in text and 'JAZZ' in text and 'COED' not in text:
+            return 'Open Jazz'
+        elif 'OPEN' in text and 'JAZZ' in text and 'COED' in text:
+            return 'Open Coed Jazz'
+        elif 'OPEN' in text and 'POM' in text and 'COED' not in text:
+            return 'Open Pom'
+        elif 'OPEN' in text and 'POM' in text and 'COED' in text:
+            return 'Open Coed Pom'
+        elif 'OPEN' in text and 'HIP HOP' in text and 'COED' not in text:
+            return 'Open Hip Hop'
+        elif 'OPEN' in text and 'HIP HOP' in text and 'COED' in text:
+            return 'Open Coed Hip Hop'
+        elif 'JUNIOR' in text:
+            return 'Junior Dance'
+    
+    return None
+
 def extract_country_from_text(text):
     """
     Extract country from text using country codes and names
@@ -727,6 +758,9 @@ def create_enhanced_csv(records):
     # Show detailed summary
     print_enhanced_summary(df)
     
+    # Check the new dataset for impossible states
+    print_validation_report(validate_dataset(df))
+    
     return df
 
 def categorize_dance_type(category):
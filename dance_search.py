@@ -0,0 +1,248 @@
+# Dance Worlds Studio / Team Search - typo tolerant lookup over the cleaned dataset
+# Keeps a trigram index of distinct Studio_Name and Team_Name values, saved as JSON,
+# that can be extended as new records arrive and used to suggest countries for research
+
+import pandas as pd
+from collections import Counter
+import argparse
+import json
+import os
+import re
+import time
+
+from dance_compact import load_compact
+
+INDEX_FILE = 'dance_worlds_search_index.json'
+SEARCH_FIELDS = ['Studio_Name', 'Team_Name']
+
+def normalise_name(name):
+    """Lower-case and drop punctuation so "Dancer'S Edge" and "dancers edge" compare equal"""
+    name = str(name).casefold().replace("'", '')
+    name = re.sub(r'[^\w\s]', ' ', name)
+    return re.sub(r'\s+', ' ', name).strip()
+
+def trigrams(normalised):
+    """Character trigrams with padding so short names and word starts still match"""
+    padded = f"  {normalised} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def new_search_index():
+    """Empty index: one entry per distinct (field, name) plus trigram postings"""
+    return {
+        'names': [],
+        'fields': [],
+        'normalised': [],
+        'sizes': [],
+        'records': [],
+        'countries': [],
+        'ids': {},
+        'postings': {}
+    }
+
+def add_name(index, field, name, records=1, countries=None):
+    """Add one name to the index, or update its record and country counts if present"""
+    key = (field, name)
+    name_id = index['ids'].get(key)
+
+    if name_id is None:
+        name_id = len(index['names'])
+        normalised = normalise_name(name)
+        grams = trigrams(normalised)
+
+        index['ids'][key] = name_id
+        index['names'].append(name)
+        index['fields'].append(field)
+        index['normalised'].append(normalised)
+        index['sizes'].append(len(grams))
+        index['records'].append(0)
+        index['countries'].append({})
+
+        for gram in grams:
+            index['postings'].setdefault(gram, set()).add(name_id)
+
+    index['records'][name_id] += records
+    for country, count in (countries or {}).items():
+        index['countries'][name_id][country] = index['countries'][name_id].get(country, 0) + count
+
+    return name_id
+
+def add_records(index, df):
+    """
+    Add the studio and team names of a batch of results to the index
+
+    Counts are aggregated per distinct name first, so only new names touch the
+    trigram postings and re-adding a batch of known names is cheap.
+    """
+    for field in SEARCH_FIELDS:
+        if field not in df.columns:
+            continue
+
+        # Plain strings so categorical columns do not yield unobserved combinations
+        names = df[field].dropna().astype(str)
+
+        if 'Country' in df.columns:
+            countries = df.loc[names.index, 'Country'].astype(object).fillna('Unknown').astype(str)
+            counts = pd.DataFrame({'Name': names, 'Country': countries}).value_counts()
+            for (name, country), count in counts.items():
+                add_name(index, field, name, records=int(count), countries={country: int(count)})
+        else:
+            for name, count in names.value_counts().items():
+                add_name(index, field, name, records=int(count))
+
+    return index
+
+def build_index_from_csv(csv_path='dance_worlds_clean_data.csv'):
+    """Build a fresh index from the cleaned dataset"""
+    return add_records(new_search_index(), load_compact(csv_path))
+
+def search_index(index, query, limit=10, min_score=0.3, fields=None):
+    """
+    Ranked, typo tolerant search
+
+    Scores are the Dice coefficient of query and name trigrams. When one name
+    contains the other (e.g. "Dancer'S Edge" vs "Dancer'S Edge Studio") the score
+    moves towards 1 by the share of the longer name the shorter one covers, so
+    extra text still lowers it and only exact matches score 1. Ties are broken by
+    how many records the name has.
+    """
+    normalised = normalise_name(query)
+    query_grams = trigrams(normalised)
+    if not normalised:
+        return []
+
+    shared = Counter()
+    for gram in query_grams:
+        postings = index['postings'].get(gram)
+        if postings:
+            shared.update(postings)
+
+    results = []
+    for name_id, overlap in shared.items():
+        if fields and index['fields'][name_id] not in fields:
+            continue
+
+        score = 2 * overlap / (len(query_grams) + index['sizes'][name_id])
+        candidate = index['normalised'][name_id]
+        if candidate == normalised:
+            score = 1.0
+        elif normalised in candidate or candidate in normalised:
+            shorter, longer = sorted([len(normalised), len(candidate)])
+            score += (1 - score) * shorter / longer
+
+        if score >= min_score:
+            results.append((score, index['records'][name_id], name_id))
+
+    results.sort(key=lambda result: (-result[0], -result[1]))
+
+    return [
+        {
+            'Name': index['names'][name_id],
+            'Field': index['fields'][name_id],
+            'Score': round(score, 3),
+            'Records': records,
+            'Country': top_country(index, name_id)
+        }
+        for score, records, name_id in results[:limit]
+    ]
+
+def top_country(index, name_id):
+    """Most common known country recorded for a name, or 'Unknown'"""
+    known = {c: n for c, n in index['countries'][name_id].items() if c != 'Unknown'}
+    return max(known, key=known.get) if known else 'Unknown'
+
+def save_index(index, path=INDEX_FILE):
+    """Save the names and counts; trigram postings are rebuilt on load"""
+    data = {
+        'names': index['names'],
+        'fields': index['fields'],
+        'records': index['records'],
+        'countries': index['countries']
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+def load_index(path=INDEX_FILE):
+    """Load a saved index"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+
+    index = new_search_index()
+    for name, field, records, countries in zip(data['names'], data['fields'], data['records'], data['countries']):
+        add_name(index, field, name, records=records, countries=countries)
+    return index
+
+def load_or_build_index(path=INDEX_FILE, csv_path='dance_worlds_clean_data.csv'):
+    """Load the saved index, building and saving it from the dataset the first time"""
+    if os.path.exists(path):
+        return load_index(path)
+    index = build_index_from_csv(csv_path)
+    save_index(index, path)
+    return index
+
+def suggest_countries(index, studios_df, name_column='Studio_Name_Clean', min_score=0.5):
+    """
+    Suggest a country for each studio still missing one in a manual research list
+
+    The studio's own entry is skipped when it has no known country, so suggestions
+    come from similarly named studios (branches, spelling variants) that do.
+    """
+    suggestions = studios_df.copy()
+    suggestions['Suggested_Country'] = ''
+    suggestions['Matched_Name'] = ''
+    suggestions['Match_Score'] = 0.0
+
+    country = suggestions['Country'] if 'Country' in suggestions.columns else pd.Series('', index=suggestions.index)
+    missing = country.isna() | country.astype(str).str.strip().isin(['', 'Unknown'])
+
+    for row_index, name in suggestions.loc[missing, name_column].items():
+        for match in search_index(index, name, limit=5, min_score=min_score, fields=['Studio_Name']):
+            if match['Country'] != 'Unknown':
+                suggestions.loc[row_index, ['Suggested_Country', 'Matched_Name', 'Match_Score']] = \
+                    [match['Country'], match['Name'], match['Score']]
+                break
+
+    return suggestions
+
+def benchmark_search(index, queries=None, repeats=200):
+    """Average lookup time over a set of queries"""
+    queries = queries or ["dancers edge", "dancer's edge studio", "pace elite", "star steppers",
+                          "dance mania", "jexer fitness", "intensity cheer", "c star"]
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for query in queries:
+            search_index(index, query)
+    elapsed = time.perf_counter() - start
+    per_query = elapsed / (repeats * len(queries))
+    print(f"{len(index['names']):,} names indexed, {per_query * 1000:.3f} ms per lookup")
+    return per_query
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Typo tolerant studio and team search")
+    parser.add_argument('query', nargs='*')
+    parser.add_argument('--index', default=INDEX_FILE)
+    parser.add_argument('--csv', default='dance_worlds_clean_data.csv')
+    parser.add_argument('--rebuild', action='store_true')
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--suggest', default=None, help="Research CSV to fill with suggested countries")
+    parser.add_argument('--benchmark', action='store_true')
+    args = parser.parse_args()
+
+    if args.rebuild and os.path.exists(args.index):
+        os.remove(args.index)
+    index = load_or_build_index(args.index, args.csv)
+
+    if args.benchmark:
+        benchmark_search(index)
+
+    if args.suggest:
+        suggestions = suggest_countries(index, pd.read_csv(args.suggest))
+        filename = os.path.splitext(args.suggest)[0] + '_suggestions.csv'
+        suggestions.to_csv(filename, index=False)
+        found = (suggestions['Suggested_Country'] != '').sum()
+        print(f"Suggested countries for {found} studios, saved as: {filename}")
+
+    if args.query:
+        query = ' '.join(args.query)
+        print(f"Results for '{query}':")
+        for result in search_index(index, query, limit=args.limit):
+            print(f"   {result['Score']:.2f}  {result['Name']} ({result['Field']}, {result['Records']} records, {result['Country']})")
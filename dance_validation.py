@@ -0,0 +1,317 @@
+# Dance Worlds Dataset Validation - checks scraped and cleaned results for impossible states
+# Rules are declared in RULES and evaluated in a few grouped, vectorised passes
+# (one per row, one per Year/Category, one per studio) instead of looping over rows
+
+import pandas as pd
+import numpy as np
+import argparse
+import time
+
+# Column names used by the scraper output and the intermediate notebook CSV
+COLUMN_ALIASES = {
+    'Category_Standardized': 'Category',
+    'Studio_Name_Clean': 'Studio_Name',
+    'Team_Name_Clean': 'Team_Name'
+}
+
+KEY_COLUMNS = ['Year', 'Category', 'Studio_Name', 'Country']
+
+def missing_keys(df):
+    """Boolean frame of missing values in the key columns the frame has"""
+    return df[[column for column in KEY_COLUMNS if column in df.columns]].isna()
+
+def describe_missing_keys(missing):
+    """'missing Year, Country' style message per row, built without a row loop"""
+    return 'missing ' + missing.dot(missing.columns + ', ').str.rstrip(', ')
+
+def as_text(values):
+    """Message text for a column: whole numbers without '.0', missing values as 'missing'"""
+    if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+        values = values.astype('Int64')
+    return values.astype(object).where(values.notna(), 'missing').map(str)
+
+# Each rule names the pass it runs in, the columns it needs and a condition that
+# returns a boolean mask over that pass's frame. Rows where the mask is True are
+# violations; `detail` builds the message for them column-wise.
+RULES = [
+    {
+        'name': 'missing_key',
+        'pass': 'row',
+        'severity': 'error',
+        'columns': ['Year', 'Category', 'Studio_Name'],
+        'description': 'Year, Category, Studio_Name or Country missing, so group checks skip the row',
+        'condition': lambda df: missing_keys(df).any(axis=1),
+        'detail': lambda df: describe_missing_keys(missing_keys(df))
+    },
+    {
+        'name': 'duplicate_rank',
+        'pass': 'category',
+        'severity': 'error',
+        'columns': ['Year', 'Category', 'Rank'],
+        'description': 'Same rank awarded more than once in a Year/Category',
+        'condition': lambda g: g['Rows'] > g['Distinct_Ranks'],
+        'detail': lambda g: as_text(g['Rows'] - g['Distinct_Ranks']) + ' duplicated rank(s)'
+    },
+    {
+        'name': 'rank_gap',
+        'pass': 'category',
+        'severity': 'warning',
+        'columns': ['Year', 'Category', 'Rank'],
+        'description': 'Ranks in a Year/Category are not a continuous 1..N sequence',
+        'condition': lambda g: g['Max_Rank'] > g['Distinct_Ranks'],
+        'detail': lambda g: as_text(g['Max_Rank'] - g['Distinct_Ranks']) + ' missing rank(s) up to ' + as_text(g['Max_Rank'])
+    },
+    {
+        'name': 'missing_champion',
+        'pass': 'category',
+        'severity': 'error',
+        'columns': ['Year', 'Category', 'Rank'],
+        'description': 'No rank 1 recorded for a Year/Category',
+        'condition': lambda g: g['Champions'] == 0,
+        'detail': lambda g: 'best rank is ' + as_text(g['Min_Rank'])
+    },
+    {
+        'name': 'studio_multiple_countries',
+        'pass': 'studio',
+        'severity': 'warning',
+        'columns': ['Studio_Name', 'Country'],
+        'description': 'Studio mapped to more than one known country',
+        'condition': lambda s: s['Countries'] > 1,
+        'detail': lambda s: s['Country_List']
+    },
+    {
+        'name': 'senior_not_usa',
+        'pass': 'row',
+        'severity': 'error',
+        'columns': ['Division', 'Country'],
+        'description': "Senior division row whose Country is not 'USA'",
+        'condition': lambda df: (df['Division'] == 'Senior') & (df['Country'] != 'USA'),
+        'detail': lambda df: 'Country is ' + as_text(df['Country'])
+    },
+    {
+        'name': 'invalid_rank',
+        'pass': 'row',
+        'severity': 'error',
+        'columns': ['Rank'],
+        'description': 'Rank missing or below 1',
+        'condition': lambda df: ~(pd.to_numeric(df['Rank'], errors='coerce') >= 1),
+        'detail': lambda df: 'Rank is ' + as_text(df['Rank'])
+    },
+    {
+        'name': 'flag_mismatch',
+        'pass': 'row',
+        'severity': 'error',
+        'columns': ['Rank', 'Is_Champion', 'Is_Podium', 'Is_Top_10'],
+        'description': 'Is_Champion/Is_Podium/Is_Top_10 disagree with Rank',
+        # Missing ranks are invalid_rank's to report, so one defect gives one violation
+        'condition': lambda df: df['Rank'].notna() & (
+                                (df['Is_Champion'] != (df['Rank'] == 1).astype(int))
+                                | (df['Is_Podium'] != (df['Rank'] <= 3).astype(int))
+                                | (df['Is_Top_10'] != (df['Rank'] <= 10).astype(int))),
+        'detail': lambda df: 'Rank ' + as_text(df['Rank'])
+    }
+]
+
+REPORT_COLUMNS = ['Rule', 'Severity', 'Year', 'Category', 'Studio_Name', 'Rank', 'Detail']
+
+def normalise_columns(df):
+    """Rename scraper/notebook column variants to the clean dataset names"""
+    renames = {old: new for old, new in COLUMN_ALIASES.items() if old in df.columns and new not in df.columns}
+    return df.rename(columns=renames) if renames else df
+
+def category_frame(df):
+    """One row per Year/Category with the rank aggregates the category rules use"""
+    # Group on integer codes rather than the Category strings - much faster on large frames
+    category_codes, categories = pd.factorize(df['Category'])
+
+    # Missing keys are reported by missing_key and missing ranks by invalid_rank;
+    # factorize codes them -1, which take() would map to the last category
+    present = (category_codes >= 0) & df['Year'].notna().to_numpy() & df['Rank'].notna().to_numpy()
+    ranks = pd.DataFrame({
+        'Year': df['Year'].to_numpy()[present],
+        'Category_Code': category_codes[present],
+        'Rank': df['Rank'].to_numpy()[present],
+        'Is_First': (df['Rank'] == 1).to_numpy()[present]
+    })
+    groups = ranks.groupby(['Year', 'Category_Code'], sort=False).agg(
+        Rows=('Rank', 'size'),
+        Distinct_Ranks=('Rank', 'nunique'),
+        Min_Rank=('Rank', 'min'),
+        Max_Rank=('Rank', 'max'),
+        Champions=('Is_First', 'sum')
+    ).reset_index()
+    groups.insert(1, 'Category', categories.take(groups.pop('Category_Code')))
+    return groups
+
+def studio_frame(df):
+    """One row per studio with the number of known countries it is mapped to"""
+    # Rows missing either key are left to missing_key so factorize never yields -1
+    known = df.loc[
+        df['Studio_Name'].notna() & df['Country'].notna() & (df['Country'] != 'Unknown'),
+        ['Studio_Name', 'Country']
+    ]
+    studio_codes, studios = pd.factorize(known['Studio_Name'])
+    country_codes, countries = pd.factorize(known['Country'])
+
+    # Distinct (studio, country) pairs as single integers, then count per studio
+    pairs = np.unique(studio_codes.astype(np.int64) * len(countries) + country_codes)
+    pair_studios = pairs // max(len(countries), 1)
+    pair_countries = pairs % max(len(countries), 1)
+
+    mapping = pd.DataFrame({
+        'Studio_Name': studios.take(pair_studios),
+        'Country': countries.take(pair_countries)
+    })
+    mapping = mapping.sort_values('Country')
+    grouped = mapping.groupby('Studio_Name', sort=False)['Country']
+    return pd.DataFrame({
+        'Countries': grouped.size(),
+        'Country_List': grouped.agg(', '.join)
+    }).reset_index()
+
+PASS_FRAMES = {
+    'row': lambda df: df,
+    'category': category_frame,
+    'studio': studio_frame
+}
+
+def run_pass(pass_name, df, rules):
+    """Build the frame for one pass once and evaluate every rule of that pass on it"""
+    pass_rules = [rule for rule in rules if rule['pass'] == pass_name]
+    if not pass_rules or len(df) == 0:
+        return []
+
+    frame = PASS_FRAMES[pass_name](df)
+    violations = []
+
+    for rule in pass_rules:
+        mask = rule['condition'](frame).fillna(True).to_numpy(dtype=bool)
+        if not mask.any():
+            continue
+
+        hits = frame.loc[mask]
+        report = pd.DataFrame({
+            column: hits[column] if column in hits.columns else np.nan
+            for column in ['Year', 'Category', 'Studio_Name', 'Rank']
+        })
+        report.insert(0, 'Rule', rule['name'])
+        report.insert(1, 'Severity', rule['severity'])
+        report['Detail'] = rule['detail'](hits)
+        violations.append(report)
+
+    return violations
+
+def applicable_rules(df, rules=None):
+    """Split the rule set into rules that can run on these columns and rules that cannot"""
+    rules = RULES if rules is None else rules
+    runnable = [rule for rule in rules if all(column in df.columns for column in rule['columns'])]
+    skipped = [rule['name'] for rule in rules if rule not in runnable]
+    return runnable, skipped
+
+def build_report(violations):
+    """Stack the per-rule violations into a single report"""
+    if not violations:
+        return pd.DataFrame(columns=REPORT_COLUMNS)
+    report = pd.concat(violations, ignore_index=True)[REPORT_COLUMNS]
+    for column in ['Year', 'Rank']:
+        report[column] = pd.to_numeric(report[column], errors='coerce').astype('Int64')
+    return report
+
+def validate_dataset(df, rules=None):
+    """
+    Evaluate the rule set against a results DataFrame
+
+    Rules whose columns are missing (e.g. Division in raw scraper output) are
+    skipped and listed in the report's `skipped_rules` attribute.
+    """
+    df = normalise_columns(df)
+    runnable, skipped = applicable_rules(df, rules)
+
+    violations = []
+    for pass_name in PASS_FRAMES:
+        violations.extend(run_pass(pass_name, df, runnable))
+
+    report = build_report(violations)
+    report.attrs['skipped_rules'] = skipped
+    return report
+
+def validate_incremental(existing_df, new_df, rules=None):
+    """
+    Validate newly ingested rows without re-checking the whole dataset
+
+    Row rules see only the new rows. Category rules see every row of the
+    Year/Category groups the new rows touch, and studio rules every row of the
+    studios they touch, so group checks stay correct without a full rescan.
+    """
+    existing_df = normalise_columns(existing_df)
+    new_df = normalise_columns(new_df)
+    runnable, skipped = applicable_rules(new_df, rules)
+
+    violations = run_pass('row', new_df, runnable)
+
+    if any(rule['pass'] == 'category' for rule in runnable):
+        touched = pd.MultiIndex.from_frame(new_df[['Year', 'Category']].drop_duplicates())
+        in_scope = pd.MultiIndex.from_frame(existing_df[['Year', 'Category']]).isin(touched)
+        violations.extend(run_pass('category', pd.concat([existing_df[in_scope], new_df]), runnable))
+
+    if any(rule['pass'] == 'studio' for rule in runnable):
+        in_scope = existing_df['Studio_Name'].isin(new_df['Studio_Name'].unique())
+        violations.extend(run_pass('studio', pd.concat([existing_df[in_scope], new_df]), runnable))
+
+    report = build_report(violations)
+    report.attrs['skipped_rules'] = skipped
+    return report
+
+def print_validation_report(report, examples=3):
+    """Print violation counts per rule with a few examples"""
+    print(f"\nValidation report:")
+    skipped = report.attrs.get('skipped_rules', [])
+    if skipped:
+        print(f"   Skipped (columns missing): {', '.join(skipped)}")
+
+    if len(report) == 0:
+        print("   No violations found")
+        return
+
+    descriptions = {rule['name']: rule['description'] for rule in RULES}
+    for rule_name, rule_df in report.groupby('Rule', sort=False):
+        print(f"\n   [{rule_df['Severity'].iloc[0]}] {rule_name}: {len(rule_df)} violation(s)")
+        if rule_name in descriptions:
+            print(f"      {descriptions[rule_name]}")
+        for _, row in rule_df.head(examples).iterrows():
+            where = ' / '.join(str(row[c]) for c in ['Year', 'Category', 'Studio_Name'] if pd.notna(row[c]))
+            print(f"      {where}: {row['Detail']}")
+
+def replicate_dataset(df, copies):
+    """Stack copies of the dataset with shifted years to simulate a larger history"""
+    year_span = df['Year'].max() - df['Year'].min() + 1
+    frames = [df.assign(Year=df['Year'] + i * year_span) for i in range(copies)]
+    return pd.concat(frames, ignore_index=True)
+
+def benchmark_validation(df, copies=(1, 10, 100, 1000)):
+    """Time a full validation on replicated datasets of increasing size"""
+    print(f"\n{'Rows':>12} {'Seconds':>10} {'Rows/sec':>14}")
+    for n in copies:
+        big = replicate_dataset(df, n)
+        start = time.perf_counter()
+        validate_dataset(big)
+        elapsed = time.perf_counter() - start
+        print(f"{len(big):>12,} {elapsed:>10.3f} {len(big) / elapsed:>14,.0f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Validate a Dance Worlds results CSV")
+    parser.add_argument('csv', nargs='?', default='dance_worlds_clean_data.csv')
+    parser.add_argument('--report', default=None, help="Write the violation report to this CSV")
+    parser.add_argument('--benchmark', action='store_true')
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.csv)
+
+    if args.benchmark:
+        benchmark_validation(normalise_columns(df))
+    else:
+        report = validate_dataset(df)
+        print_validation_report(report)
+        if args.report:
+            report.to_csv(args.report, index=False)
+            print(f"\nReport saved as: {args.report}")